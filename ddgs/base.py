@@ -4,10 +4,11 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from functools import cached_property
-from typing import Any, ClassVar, Generic, Literal, TypeVar
+from typing import Any, ClassVar, Generic, Literal, TypeVar, cast
 
 from lxml import html
 from lxml.etree import HTMLParser as LHTMLParser
+from lxml.etree import XPath
 
 from .http_client import HttpClient
 from .results import BooksResult, ImagesResult, NewsResult, TextResult, VideosResult
@@ -31,6 +32,16 @@ class BaseSearchEngine(ABC, Generic[T]):
     items_xpath: ClassVar[str]
     elements_xpath: ClassVar[Mapping[str, str]]
     elements_replace: ClassVar[Mapping[str, str]]
+    # items_xpath / elements_xpath compiled once per engine class, shared by all its instances
+    _items_xp: ClassVar[XPath]
+    _elements_xp: ClassVar[Mapping[str, XPath]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Compile the XPath selectors of engines that define them."""
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "items_xpath"):
+            cls._items_xp = XPath(cls.items_xpath)
+            cls._elements_xp = {key: XPath(value) for key, value in cls.elements_xpath.items()}
 
     def __init__(self, proxy: str | None = None, timeout: int | None = None, *, verify: bool | str = True) -> None:
         self.http_client = HttpClient(proxy=proxy, timeout=timeout, verify=verify)
@@ -85,12 +96,12 @@ class BaseSearchEngine(ABC, Generic[T]):
         """Extract search results from html text."""
         html_text = self.pre_process_html(html_text)
         tree = self.extract_tree(html_text)
-        items = tree.xpath(self.items_xpath)
+        items = cast("list[html.HtmlElement]", self._items_xp(tree))
         results = []
         for item in items:
             result = self.result_type()
-            for key, value in self.elements_xpath.items():
-                data = " ".join(x.strip() for x in item.xpath(value))
+            for key, xp in self._elements_xp.items():
+                data = " ".join(x.strip() for x in cast("list[str]", xp(item)))
                 result.__setattr__(key, data)
             results.append(result)
         return results
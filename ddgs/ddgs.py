@@ -208,7 +208,7 @@ class DDGS:
         results = results_aggregator.extract_dicts()
         # Rank results
         ranker = SimpleFilterRanker()
-        results = ranker.rank(results, query)
+        results = ranker.rank(results, query, top_k=max_results or None)
 
         if results:
             return results[:max_results] if max_results else results
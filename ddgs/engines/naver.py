@@ -22,12 +22,21 @@ class Naver(BaseSearchEngine[TextResult]):
 
     # XPath selectors for Naver search results
     # Note: Naver's HTML structure may vary, these are common patterns
-    items_xpath = "//div[contains(@class, 'total_wrap')] | //li[contains(@class, 'bx')] | //div[contains(@class, 'api_subject_bx')]"
+    items_xpath = (
+        "//div[contains(@class, 'total_wrap') or contains(@class, 'api_subject_bx')] | //li[contains(@class, 'bx')]"
+    )
     elements_xpath: ClassVar[Mapping[str, str]] = {
         "title": ".//a[contains(@class, 'link_tit') or contains(@class, 'total_tit') or contains(@class, 'api_txt_lines')]//text() | .//strong[@class='ell']//text()",
         "href": ".//a[contains(@class, 'link_tit') or contains(@class, 'total_tit') or @class='link']/@href",
         "body": ".//div[contains(@class, 'total_txt') or contains(@class, 'api_txt_lines')] //text() | .//p[contains(@class, 'api_txt_lines')]//text() | .//dd[contains(@class, 'txt')]//text()",
     }
+    # Timelimit mapping (Naver uses 'nso' parameter with format so:r,p:[period])
+    period_map: ClassVar[Mapping[str, str]] = {
+        "d": "1d",  # Last day
+        "w": "1w",  # Last week
+        "m": "1m",  # Last month
+        "y": "1y",  # Last year
+    }
 
     def build_payload(
         self,
@@ -56,17 +65,8 @@ class Naver(BaseSearchEngine[TextResult]):
             if lang == "ko" or country == "kr":
                 payload["sm"] = "top_hty"  # Korean search mode
 
-        # Timelimit mapping (Naver uses 'nso' parameter)
-        # Format: nso=so:r,p:[period]
-        if timelimit:
-            period_map = {
-                "d": "1d",  # Last day
-                "w": "1w",  # Last week
-                "m": "1m",  # Last month
-                "y": "1y",  # Last year
-            }
-            if timelimit in period_map:
-                payload["nso"] = f"so:r,p:{period_map[timelimit]}"
+        if timelimit and (period := self.period_map.get(timelimit)):
+            payload["nso"] = f"so:r,p:{period}"
 
         return payload
 
@@ -78,10 +78,8 @@ class Naver(BaseSearchEngine[TextResult]):
             if not result.href or not result.title:
                 continue
 
-            # Skip Naver's internal ads and related searches
-            if "searchad.naver.com" in result.href:
-                continue
-            if result.href.startswith("https://search.naver.com/search.naver"):
+            # Skip Naver's related searches and internal ads
+            if result.href.startswith("https://search.naver.com/search.naver") or "searchad.naver.com" in result.href:
                 continue
 
             # Clean up the body text
@@ -1,7 +1,57 @@
 """Simple filter ranker."""
 
-import re
-from typing import Final
+import heapq
+import string
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Final, cast
+
+
+class _SeparatorTable(dict[int, int]):
+    """``str.translate`` table that maps every non-word character to a space, filled in lazily."""
+
+    def __missing__(self, key: int) -> int:
+        char = chr(key)
+        value = key if char.isalnum() or char == "_" else 32
+        self[key] = value
+        return value
+
+
+_separators: Final = _SeparatorTable({ord(char): 32 for char in string.punctuation + string.whitespace if char != "_"})
+
+
+@lru_cache(maxsize=1024)
+def _extract_tokens(query: str, min_token_length: int) -> frozenset[str]:
+    """Split a lower-cased query on non-word characters & filter out short tokens."""
+    return frozenset(token for token in query.translate(_separators).split() if len(token) >= min_token_length)
+
+
+@lru_cache(maxsize=1024)
+def _compile_tokens(tokens: frozenset[str]) -> tuple[str, ...]:
+    """Reduce a token set to the minimal tuple of substrings to scan for.
+
+    A token that contains another token is implied by it and is dropped, so each text is
+    walked once per remaining token; shorter tokens go first to short-circuit the match early.
+    """
+    ordered = sorted(tokens, key=lambda tok: (len(tok), tok))
+    patterns: list[str] = []
+    for tok in ordered:
+        if not any(p in tok for p in patterns):
+            patterns.append(tok)
+    return tuple(patterns)
+
+
+@lru_cache(maxsize=1024)
+def _compile_matcher(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a function that tells whether a text contains any of the patterns.
+
+    The ``in`` tests are unrolled into a single ``or`` chain with ``exec``, which avoids the
+    generator frame of ``any`` on every call. Patterns are embedded via ``repr``.
+    """
+    body = " or ".join(f"{pattern!r} in text" for pattern in patterns) or "False"
+    namespace: dict[str, Any] = {}
+    exec(f"def _hit(text):\n    return {body}", namespace)  # noqa: S102
+    return cast("Callable[[str], bool]", namespace["_hit"])
 
 
 class SimpleFilterRanker:
@@ -16,69 +66,46 @@ class SimpleFilterRanker:
     3) Return results sorted by priority, then by relevance within each priority.
     """
 
-    _splitter: Final = re.compile(r"\W+")
-
     def __init__(self, min_token_length: int = 3) -> None:
         self.min_token_length = min_token_length
 
-    def _extract_tokens(self, query: str) -> set[str]:
-        """Split on non-word characters & filter out short tokens."""
-        return {token for token in self._splitter.split(query.lower()) if len(token) >= self.min_token_length}
-
-    def _has_any_token(self, text: str, tokens: set[str]) -> bool:
-        """Check if any token is a substring of the lower-cased text."""
-        lower_text = text.lower()
-        return any(tok in lower_text for tok in tokens)
-
-    def rank(self, docs: list[dict[str, str]], query: str) -> list[dict[str, str]]:
-        """Rank a list of docs based on a query string and engine priority."""
-        tokens = self._extract_tokens(query)
-
-        # Group results by priority
-        priority_groups: dict[float, dict[str, list[dict[str, str]]]] = {}
-
-        for doc in docs:
-            href = doc.get("href", "")
-            title = doc.get("title", "")
-            # fallback to 'description' if no 'body'
-            body = doc.get("body", doc.get("description", ""))
-
-            # Skip Wikimedia category pages
-            if all(x in title for x in ["Category:", "Wikimedia"]):
-                continue
-
-            # Get engine priority (default to 1 if not set)
-            priority = doc.get("engine_priority", 1)
-
-            # Initialize priority group if needed
-            if priority not in priority_groups:
-                priority_groups[priority] = {
-                    "both": [],
-                    "title_only": [],
-                    "body_only": [],
-                    "neither": [],
-                }
-
-            # Title / Body match
-            hit_title = self._has_any_token(title, tokens)
-            hit_body = self._has_any_token(body, tokens)
-
-            if hit_title and hit_body:
-                priority_groups[priority]["both"].append(doc)
-            elif hit_title:
-                priority_groups[priority]["title_only"].append(doc)
-            elif hit_body:
-                priority_groups[priority]["body_only"].append(doc)
-            else:
-                priority_groups[priority]["neither"].append(doc)
-
-        # Build final ranking: sort by priority (high to low), then by relevance
-        final_results = []
-        for priority in sorted(priority_groups.keys(), reverse=True):
-            group = priority_groups[priority]
-            final_results.extend(group["both"])
-            final_results.extend(group["title_only"])
-            final_results.extend(group["body_only"])
-            final_results.extend(group["neither"])
-
-        return final_results
+    def rank(self, docs: list[dict[str, str]], query: str, top_k: int | None = None) -> list[dict[str, str]]:
+        """Rank a list of docs based on a query string and engine priority.
+
+        If ``top_k`` is given, only the ``top_k`` best-ranked docs are returned.
+        """
+        hit = _compile_matcher(_compile_tokens(_extract_tokens(query.lower(), self.min_token_length)))
+
+        # Pull each field into its own column once, then scan the columns in tight loops
+        titles = [doc.get("title", "") for doc in docs]
+        # fallback to 'description' if no 'body'
+        bodies = [doc.get("body", doc.get("description", "")) for doc in docs]
+        # engine priority defaults to 1 if not set
+        priorities = [float(doc.get("engine_priority", 1)) for doc in docs]
+
+        # Title / Body match (lower-case each text once)
+        lower_titles = list(map(str.lower, titles))
+        lower_bodies = list(map(str.lower, bodies))
+        hit_titles = list(map(hit, lower_titles))
+        # A body that repeats a matching title verbatim inherits its hit without a rescan
+        hit_bodies = [
+            (hit_title and body.startswith(title)) or hit(body)
+            for title, body, hit_title in zip(lower_titles, lower_bodies, hit_titles, strict=True)
+        ]
+
+        # Key each result by (priority desc, bucket): 0 both, 1 title only, 2 body only, 3 neither
+        keys = [
+            (-priority, (not hit_t) * 2 + (not hit_b))
+            for priority, hit_t, hit_b in zip(priorities, hit_titles, hit_bodies, strict=True)
+        ]
+
+        # Skip Wikimedia category pages
+        order = [i for i, title in enumerate(titles) if not ("Category:" in title and "Wikimedia" in title)]
+        # Both keep the original order within each (priority, bucket); a bounded heap is
+        # cheaper than a full sort when only a few of many results are wanted
+        if top_k is not None and top_k < len(order) // 4:
+            order = heapq.nsmallest(top_k, order, key=keys.__getitem__)
+        else:
+            order.sort(key=keys.__getitem__)
+            order = order[:top_k]
+        return [docs[i] for i in order]
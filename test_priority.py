@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test script to verify Naver and Google priority search."""
 
+from collections import Counter
+
 from ddgs import DDGS
 
 
@@ -39,21 +41,19 @@ def test_priority_search():
 
             # Count results by engine
             print("\n=== Results by Engine ===")
-            engine_counts = {}
+            engine_counts = Counter()
+            engine_priorities = {}
             for result in results:
                 engine = result.get("engine_name", "unknown")
-                engine_counts[engine] = engine_counts.get(engine, 0) + 1
+                engine_counts[engine] += 1
+                engine_priorities.setdefault(engine, result.get("engine_priority", "N/A"))
 
             for engine, count in sorted(
                 engine_counts.items(),
-                key=lambda x: results[[r.get("engine_name") for r in results].index(x[0])].get("engine_priority", 0),
-                reverse=True
+                key=lambda x: 0 if engine_priorities[x[0]] == "N/A" else engine_priorities[x[0]],
+                reverse=True,
             ):
-                priority = next(
-                    (r.get("engine_priority", "N/A") for r in results if r.get("engine_name") == engine),
-                    "N/A"
-                )
-                print(f"{engine}: {count} results (priority: {priority})")
+                print(f"{engine}: {count} results (priority: {engine_priorities[engine]})")
 
     except Exception as e:
         print(f"\nError during search: {type(e).__name__}: {e}")
@@ -0,0 +1,98 @@
+import random
+from typing import Any
+
+import pytest
+
+from ddgs.similarity import SimpleFilterRanker
+
+ranker = SimpleFilterRanker()
+
+
+def _titles(results: list[dict[str, str]]) -> list[str]:
+    return [r["title"] for r in results]
+
+
+def test_bucket_order() -> None:
+    docs = [
+        {"title": "nothing here", "body": "nothing"},
+        {"title": "nothing", "body": "python body"},
+        {"title": "Python title", "body": "nothing"},
+        {"title": "PYTHON both", "body": "about python"},
+    ]
+    assert _titles(ranker.rank(docs, "python")) == ["PYTHON both", "Python title", "nothing", "nothing here"]
+
+
+def test_priority_before_relevance() -> None:
+    docs: list[dict[str, Any]] = [
+        {"title": "python", "body": "python", "engine_priority": 1},
+        {"title": "other", "body": "other", "engine_priority": 3},
+        {"title": "python low", "body": "x", "engine_priority": 2},
+        {"title": "no priority", "body": "python"},
+    ]
+    assert _titles(ranker.rank(docs, "python")) == ["other", "python low", "python", "no priority"]
+
+
+def test_stable_ties() -> None:
+    docs = [{"title": f"python {i}", "body": "python"} for i in range(10)]
+    assert ranker.rank(docs, "python") == docs
+
+
+def test_skip_wikimedia_category() -> None:
+    docs = [
+        {"title": "Category:Python - Wikimedia Commons", "body": "python"},
+        {"title": "Category:Python", "body": "python"},
+        {"title": "Wikimedia python", "body": "python"},
+    ]
+    assert _titles(ranker.rank(docs, "python")) == ["Category:Python", "Wikimedia python"]
+
+
+def test_body_description_fallback() -> None:
+    docs = [
+        {"title": "a", "description": "x"},
+        {"title": "b", "description": "python"},
+        {"title": "c", "body": "", "description": "python"},
+    ]
+    # 'description' is used only when there is no 'body' key
+    assert _titles(ranker.rank(docs, "python")) == ["b", "a", "c"]
+
+
+def test_query_tokens() -> None:
+    docs = [
+        {"title": "short", "body": "is it ok"},
+        {"title": "under_score", "body": "x"},
+        {"title": "program", "body": "x"},
+        {"title": "café", "body": "x"},
+    ]
+    # tokens shorter than 3 chars are dropped, '_' is a word character, 'programming' is implied by 'program'
+    ranked = ranker.rank(docs, "is under_score, PROGRAM programming Café?")
+    assert _titles(ranked) == ["under_score", "program", "café", "short"]
+
+
+def test_body_starting_with_title() -> None:
+    docs = [
+        {"title": "Python", "body": "Python is a language"},
+        {"title": "Python", "body": "Pythonic"},
+        {"title": "Python", "body": "Pyth"},
+    ]
+    assert _titles(ranker.rank(docs, "python")) == ["Python", "Python", "Python"]
+    assert ranker.rank(docs, "python")[2] is docs[2]
+
+
+@pytest.mark.parametrize("n_docs", [0, 1, 8, 40, 200])
+def test_top_k_matches_full_rank(n_docs: int) -> None:
+    rnd = random.Random(n_docs)
+    words = ["python", "Programming", "wolf", "tiger", "Category:", "Wikimedia", "café", "the"]
+    docs = []
+    for i in range(n_docs):
+        doc: dict[str, Any] = {"href": str(i), "title": " ".join(rnd.choices(words, k=rnd.randint(0, 4)))}
+        if rnd.random() < 0.7:
+            doc["body"] = " ".join(rnd.choices(words, k=rnd.randint(0, 6)))
+        else:
+            doc["description"] = " ".join(rnd.choices(words, k=rnd.randint(0, 6)))
+        if rnd.random() < 0.8:
+            doc["engine_priority"] = rnd.choice([1, 2, 3])
+        docs.append(doc)
+    full = ranker.rank(docs, "python programming")
+    # k on both sides of the len(order) // 4 heap threshold
+    for k in [0, 1, 2, n_docs // 8, n_docs // 4, n_docs // 2, n_docs, n_docs + 5]:
+        assert ranker.rank(docs, "python programming", top_k=k) == full[:k]